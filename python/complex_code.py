@@ -1,17 +1,39 @@
 """
 This file contains intentionally complex code to test code complexity analysis.
 """
-from typing import List, Dict, Any, Optional, Union, Tuple
+from typing import List, Dict, Any, Optional, Tuple
 import re
 import math
 
+import numpy as np
+
+try:
+    import re2 as _email_re  # linear-time DFA matcher from google-re2
+except ImportError:
+    _email_re = re
+
+_LONG_WORD_RE = re.compile(r'\b\w{6,}\b')
+_PRIORITY_RE = re.compile(r'\b(?:critical|important|urgent|high|medium|low)\b')  # match lowercased text
+_EMAIL_RE = _email_re.compile(r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}')  # use fullmatch
+
+
+def _as_float(value: Any) -> float:
+    """Convert a value to float, mapping non-numeric values to NaN."""
+    try:
+        return float(value)
+    except (ValueError, TypeError):
+        return math.nan
+
+
 class ComplexProcessor:
     """A class with high complexity methods for testing purposes."""
     
+    # Factorials of 0-9, the full domain used by _process_high_value
+    _FACTORIALS = (1, 1, 2, 6, 24, 120, 720, 5040, 40320, 362880)
+    
     def __init__(self, data: List[Dict[str, Any]]):
         self.data = data
         self._processed_data = {}
-        self._cache = {}
     
     def process_data(self, threshold: int = 10) -> Dict[str, List[Any]]:
         """Process data with multiple nested conditions and loops."""
@@ -21,96 +43,106 @@ class ComplexProcessor:
             'low': []
         }
         
-        for item in self.data:
-            if not item or 'value' not in item:
-                continue
-                
-            value = item['value']
-            category = self._categorize_value(value, threshold)
-            
-            if category == 'high':
-                processed = self._process_high_value(item)
-                result['high'].append(processed)
-            elif category == 'medium':
-                processed = self._process_medium_value(item)
-                result['medium'].append(processed)
-            else:
-                processed = self._process_low_value(item)
-                result['low'].append(processed)
+        items = [item for item in self.data if item and 'value' in item]
+        
+        # Categorize all numeric values in one vectorized pass
+        values = np.fromiter((_as_float(item['value']) for item in items),
+                             dtype=np.float64, count=len(items))
+        categories = np.where(values > threshold * 2, 0, np.where(values > threshold, 1, 2))
+        
+        # NaN entries start out low; long non-numeric strings use the length rules
+        for i in np.flatnonzero(np.isnan(values)).tolist():
+            value = items[i]['value']
+            if isinstance(value, str) and len(value) > 10:
+                try:
+                    float(value)  # a padded 'nan' string is still numeric
+                except ValueError:
+                    categories[i] = 0 if len(value) > 20 else 1
+        
+        # Category indices map straight onto handlers and output buckets
+        handlers = (self._process_high_value, self._process_medium_value, self._process_low_value)
+        buckets = (result['high'], result['medium'], result['low'])
+        for item, category in zip(items, categories.tolist()):
+            buckets[category].append(handlers[category](item))
                 
             # Additional processing based on item type
             if 'type' in item:
                 self._process_by_type(item, result)
+        
+        # Validate all collected emails in a single batch
+        users = result.get('users', [])
+        for user, is_valid in zip(users, self._validate_emails([user['email'] for user in users])):
+            user['is_valid'] = is_valid
                 
         return result
     
-    def _categorize_value(self, value: Union[int, float, str], threshold: int) -> str:
-        """Categorize value into high, medium, or low."""
-        try:
-            num = float(value)
-            if num > threshold * 2:
-                return 'high'
-            elif num > threshold:
-                return 'medium'
-            return 'low'
-        except (ValueError, TypeError):
-            if isinstance(value, str) and len(value) > 10:
-                return 'high' if len(value) > 20 else 'medium'
-            return 'low'
-    
     def _process_high_value(self, item: Dict[str, Any]) -> Dict[str, Any]:
         """Process high value items with complex logic."""
-        result = item.copy()
+        # Collect new fields locally and merge them into the item once
+        fields = {}
         
         # Complex processing based on multiple conditions
-        if 'tags' in item and isinstance(item['tags'], list):
-            result['tag_count'] = len(item['tags'])
-            result['has_priority'] = any(tag.get('priority') for tag in item['tags'])
+        # Exact type checks skip the MRO walk that isinstance performs
+        tags = item.get('tags')
+        if type(tags) is list:
+            has_priority = False
+            categories = None
             
-            # Nested loop with condition
-            for tag in item['tags']:
-                if isinstance(tag, dict) and 'category' in tag:
-                    result.setdefault('categories', set()).add(tag['category'])
+            # Single pass for both the priority flag and the categories
+            for tag in tags:
+                if type(tag) is dict:
+                    if not has_priority and tag.get('priority'):
+                        has_priority = True
+                    if 'category' in tag:
+                        if categories is None:
+                            categories = set()
+                        categories.add(tag['category'])
+            
+            fields['tag_count'] = len(tags)
+            fields['has_priority'] = has_priority
+            if categories:
+                fields['categories'] = categories
         
         # Complex string manipulation
-        if 'description' in item and isinstance(item['description'], str):
+        description = item.get('description')
+        if type(description) is str:
             # Count words longer than 5 characters
-            words = re.findall(r'\b\w{6,}\b', item['description'])
-            result['long_word_count'] = len(words)
+            words = _LONG_WORD_RE.findall(description)
+            fields['long_word_count'] = len(words)
             
-            # Check for specific patterns
-            patterns = [r'\b(?:critical|important|urgent)\b', r'\b(?:high|medium|low)\b']
-            for pattern in patterns:
-                if re.search(pattern, item['description'], re.IGNORECASE):
-                    result['has_priority_keywords'] = True
-                    break
+            # Check for priority or level keywords
+            if _PRIORITY_RE.search(description.lower()):
+                fields['has_priority_keywords'] = True
         
         # Complex mathematical operation
         if 'value' in item and isinstance(item['value'], (int, float)):
-            result['factorial'] = self._calculate_factorial(int(abs(item['value'])) % 10)
+            fields['factorial'] = ComplexProcessor._FACTORIALS[int(abs(item['value'])) % 10]
             
-        return result
+        return item | fields
     
     def _process_medium_value(self, item: Dict[str, Any]) -> Dict[str, Any]:
         """Process medium value items with moderate complexity."""
         result = item.copy()
         
         if 'metadata' in item and isinstance(item['metadata'], dict):
-            result['metadata'] = {k.upper(): str(v) for k, v in item['metadata'].items()}
+            metadata = {}
+            has_nested = False
             
-            # Nested dictionary processing
+            # Uppercase keys and look for nested dictionaries in one pass
             for key, value in item['metadata'].items():
-                if isinstance(value, dict) and 'nested' in value:
-                    result['has_nested'] = True
-                    break
+                metadata[key.upper()] = str(value)
+                if not has_nested and isinstance(value, dict) and 'nested' in value:
+                    has_nested = True
+            
+            result['metadata'] = metadata
+            if has_nested:
+                result['has_nested'] = True
                     
         return result
     
     def _process_low_value(self, item: Dict[str, Any]) -> Dict[str, Any]:
         """Process low value items with simple logic."""
-        result = item.copy()
-        result['processed'] = True
-        return result
+        return item | {'processed': True}
     
     def _process_by_type(self, item: Dict[str, Any], result: Dict[str, List[Any]]) -> None:
         """Process item based on its type with complex pattern matching."""
@@ -120,8 +152,7 @@ class ComplexProcessor:
             if 'username' in item and 'email' in item:
                 result.setdefault('users', []).append({
                     'username': item['username'],
-                    'email': item['email'],
-                    'is_valid': self._validate_email(item['email'])
+                    'email': item['email']
                 })
         elif item_type == 'product':
             if 'price' in item and 'quantity' in item:
@@ -132,29 +163,16 @@ class ComplexProcessor:
                     'discounted': self._apply_discount(total, item.get('discount', 0))
                 })
     
-    def _validate_email(self, email: str) -> bool:
-        """Validate email with regex."""
-        pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        return bool(re.match(pattern, email))
+    def _validate_emails(self, emails: List[str]) -> List[bool]:
+        """Validate a batch of emails with regex."""
+        fullmatch = _EMAIL_RE.fullmatch
+        return [bool(fullmatch(email)) for email in emails]
     
     def _apply_discount(self, amount: float, discount: float) -> float:
         """Apply discount with validation."""
         if 0 <= discount <= 100:
             return amount * (1 - discount / 100)
         return amount
-    
-    def _calculate_factorial(self, n: int) -> int:
-        """Calculate factorial with memoization."""
-        if n in self._cache:
-            return self._cache[n]
-            
-        if n == 0 or n == 1:
-            result = 1
-        else:
-            result = n * self._calculate_factorial(n - 1)
-            
-        self._cache[n] = result
-        return result
 
 
 def process_complex_data(data: List[Dict[str, Any]], 
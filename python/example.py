@@ -1,9 +1,100 @@
 """
 Example Python file with various code patterns for testing code quality.
 """
+import asyncio
+import itertools
 import os
+import platform
 import sys
-from typing import List, Optional
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from functools import lru_cache, wraps
+from typing import Any, Awaitable, Callable, Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+import psutil
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional; statistics fall back to NumPy
+    njit = None
+
+# Reuse one handle for this process rather than creating one per measurement
+_PROC = psutil.Process()
+
+# Set PERF_TRACK=0 to turn PerformanceTracker measurements into no-ops
+_PERF_TRACK = os.environ.get('PERF_TRACK') != '0'
+
+# Report layout; icons are dropped when output is not a terminal
+_HEADER = '=' * 70
+_DIVIDER = '-' * 70
+_ICONS = {
+    'start': '🚀 ',
+    'run': '🔹 ',
+    'passed': '✅ ',
+    'failed': '❌ ',
+    'duration': '⏱️  ',
+    'summary': '📊 ',
+    'success': '📈 ',
+    'none': '   '  # keeps icon-less lines aligned with the rest
+}
+_NO_ICONS = dict.fromkeys(_ICONS, '')
+
+# Simulated call IDs only need to be unique, not random
+_CALL_IDS = itertools.count()
+
+# Shared generator for all simulated latencies, failures and sample data
+_RNG = np.random.default_rng()
+
+# Single shared worker for CPU-bound work that must not block the event loop
+_EXECUTOR = ThreadPoolExecutor(max_workers=1)
+
+
+@lru_cache(maxsize=1)
+def _static_system_info() -> Dict[str, Any]:
+    """Collect the system details that stay fixed for the life of the process.
+    
+    The result is cached after the first call, so callers must not mutate it.
+    
+    Returns:
+        dict: Platform, CPU and total memory details.
+    """
+    return {
+        'platform': platform.platform(),
+        'system': platform.system(),
+        'release': platform.release(),
+        'python_version': platform.python_version(),
+        'processor': platform.processor(),
+        'cpu_count': psutil.cpu_count(),
+        'memory_total': psutil.virtual_memory().total
+    }
+
+
+if njit is not None:
+    # Allow reassociation so the sum vectorizes; NaN propagates like arr.min()/max()
+    @njit(fastmath={'reassoc', 'nsz', 'contract'})
+    def _array_stats(arr):
+        """Return min, max and mean of a non-empty array in one native pass."""
+        lo = hi = arr[0]
+        total = 0.0
+        for x in arr:
+            if x != x:
+                return np.nan, np.nan, np.nan
+            total += x
+            if x < lo:
+                lo = x
+            elif x > hi:
+                hi = x
+        return lo, hi, total / arr.size
+
+    # Compile at import so the first real call pays no JIT cost
+    _array_stats(np.zeros(2))
+else:
+    def _array_stats(arr):
+        """Return min, max and mean of a non-empty array."""
+        return arr.min(), arr.max(), arr.mean()
 
 
 def calculate_average(numbers: List[float]) -> float:
@@ -15,9 +106,7 @@ def calculate_average(numbers: List[float]) -> float:
     Returns:
         float: The average of the numbers.
     """
-    if not numbers:
-        return 0.0
-    return sum(numbers) / len(numbers)
+    return sum(numbers) / len(numbers) if numbers else 0.0
 
 
 class DataProcessor:
@@ -25,12 +114,26 @@ class DataProcessor:
     
     def __init__(self, data: List[float]):
         self.data = data
+    
+    @property
+    def data(self) -> List[float]:
+        """The current data as a plain list.
+        
+        The getter returns a copy, so mutating it does not change the processor;
+        assign a new list instead.
+        """
+        return self._arr.tolist()
+    
+    @data.setter
+    def data(self, data: List[float]) -> None:
+        # Copy into our own buffer so in-place updates never touch the caller's data
+        self._arr = np.array(data, dtype=np.float64)
         self._processed = False
     
     def process_data(self) -> None:
         """Process the internal data."""
         if not self._processed:
-            self.data = [x * 2 for x in self.data]
+            np.multiply(self._arr, 2.0, out=self._arr)
             self._processed = True
     
     def get_statistics(self) -> dict:
@@ -39,16 +142,33 @@ class DataProcessor:
         Returns:
             dict: Dictionary containing min, max, and average.
         """
-        if not self.data:
+        if self._arr.size == 0:
             return {}
             
+        lo, hi, mean = _array_stats(self._arr)
         return {
-            'min': min(self.data),
-            'max': max(self.data),
-            'average': calculate_average(self.data)
+            'min': float(lo),
+            'max': float(hi),
+            'average': float(mean)
         }
 
 
+def iter_file_lines(file_path: str) -> Iterator[str]:
+    """Lazily yield the non-empty lines of a file.
+    
+    Args:
+        file_path: Path to the file to read.
+        
+    Yields:
+        str: Each non-empty line with surrounding whitespace stripped.
+    """
+    with open(file_path, 'r', buffering=1 << 20) as file:
+        for line in file:
+            stripped = line.strip()
+            if stripped:
+                yield stripped
+
+
 def process_file(file_path: str) -> Optional[List[str]]:
     """Read and process a file.
     
@@ -59,8 +179,7 @@ def process_file(file_path: str) -> Optional[List[str]]:
         List of lines from the file, or None if file not found.
     """
     try:
-        with open(file_path, 'r') as file:
-            return [line.strip() for line in file if line.strip()]
+        return list(iter_file_lines(file_path))
     except FileNotFoundError:
         print(f"Error: File {file_path} not found.")
         return None
@@ -69,28 +188,18 @@ def process_file(file_path: str) -> Optional[List[str]]:
         return None
 
 
-import time
-import asyncio
-import random
-import uuid
-import platform
-import psutil
-from functools import wraps
-from concurrent.futures import ThreadPoolExecutor
-from datetime import datetime
-from typing import Dict, List, Any, Optional, Callable, Awaitable
-
 class PerformanceTracker:
     """Enhanced performance tracking with context manager support."""
     
     def __init__(self, name: str = None):
         self.name = name or 'operation'
-        self.start_time: float = 0
-        self.end_time: float = 0
+        self.start_ns: int = 0
+        self.end_ns: int = 0
         self.start_memory: int = 0
         self.end_memory: int = 0
         self._start_cpu = None
         self._end_cpu = None
+        self._timestamp: Optional[str] = None
     
     def __enter__(self):
         self.start()
@@ -101,28 +210,42 @@ class PerformanceTracker:
     
     def start(self) -> None:
         """Start tracking performance metrics."""
-        self.start_time = time.perf_counter()
+        if not _PERF_TRACK:
+            return
+        self.start_ns = time.perf_counter_ns()
         self._start_cpu = time.process_time()
-        self.start_memory = psutil.Process().memory_info().rss
+        self.start_memory = _PROC.memory_info().rss
     
     def stop(self) -> Dict[str, Any]:
         """Stop tracking and return metrics."""
-        self.end_time = time.perf_counter()
-        self._end_cpu = time.process_time()
-        self.end_memory = psutil.Process().memory_info().rss
+        if _PERF_TRACK:
+            self.end_ns = time.perf_counter_ns()
+            self._end_cpu = time.process_time()
+            self.end_memory = _PROC.memory_info().rss
+        self._timestamp = datetime.utcnow().isoformat()
         
         return self.metrics
     
+    @property
+    def start_time(self) -> float:
+        """Start time in seconds, derived from start_ns."""
+        return self.start_ns / 1e9
+    
+    @property
+    def end_time(self) -> float:
+        """End time in seconds, derived from end_ns."""
+        return self.end_ns / 1e9
+    
     @property
     def metrics(self) -> Dict[str, Any]:
         """Get current metrics."""
-        wall_time = self.end_time - self.start_time if self.end_time > 0 else 0
+        wall_time = (self.end_ns - self.start_ns) / 1e9 if self.end_ns > 0 else 0
         cpu_time = (self._end_cpu - self._start_cpu) if self._end_cpu else 0
         memory_used = (self.end_memory - self.start_memory) / (1024 * 1024)  # in MB
         
         return {
             'name': self.name,
-            'timestamp': datetime.utcnow().isoformat(),
+            'timestamp': self._timestamp or datetime.utcnow().isoformat(),
             'wall_time': wall_time,
             'cpu_time': cpu_time,
             'memory_used_mb': memory_used,
@@ -131,22 +254,28 @@ class PerformanceTracker:
             'cpu_percent': (cpu_time / wall_time * 100) if wall_time > 0 else 0
         }
 
-def measure_performance(func=None, *, name: str = None):
-    """Decorator to measure function execution time and resource usage."""
+def measure_performance(func=None, *, name: str = None, enabled: bool = True):
+    """Decorator to measure function execution time and resource usage.
+    
+    When ``enabled`` is False or PERF_TRACK=0 is set, the function is returned
+    unwrapped, so it pays no tracking cost and returns its own result directly.
+    """
     def decorator(f):
+        if not (enabled and _PERF_TRACK):
+            return f
+        
         @wraps(f)
         async def async_wrapper(*args, **kwargs):
             tracker = PerformanceTracker(name or f.__name__)
             tracker.start()
             try:
                 result = await f(*args, **kwargs)
-                metrics = tracker.metrics
                 return {
                     'result': result,
-                    'metrics': metrics
+                    'metrics': tracker.stop()
                 }
             except Exception as e:
-                metrics = tracker.metrics
+                metrics = tracker.stop()
                 metrics['error'] = str(e)
                 return {
                     'error': str(e),
@@ -159,13 +288,12 @@ def measure_performance(func=None, *, name: str = None):
             tracker.start()
             try:
                 result = f(*args, **kwargs)
-                metrics = tracker.metrics
                 return {
                     'result': result,
-                    'metrics': metrics
+                    'metrics': tracker.stop()
                 }
             except Exception as e:
-                metrics = tracker.metrics
+                metrics = tracker.stop()
                 metrics['error'] = str(e)
                 return {
                     'error': str(e),
@@ -181,24 +309,30 @@ def measure_performance(func=None, *, name: str = None):
 async def simulate_api_call(endpoint: str, method: str = 'GET', timeout: float = 5.0, 
                          max_retries: int = 2) -> Dict[str, Any]:
     """Simulate an API call with retry logic and error handling."""
-    test_id = str(uuid.uuid4())[:8]
+    test_id = f"{next(_CALL_IDS):08x}"
     attempts = 0
     last_error = None
     
+    # Bind hot lookups to locals for the retry loop
+    monotonic_ns = time.monotonic_ns
+    sleep = asyncio.sleep
+    uniform = _RNG.uniform
+    rand = _RNG.random
+    
     while attempts <= max_retries:
         attempts += 1
-        start_time = time.perf_counter()
+        start_ns = monotonic_ns()
         
         try:
             # Simulate network delay (100-500ms)
-            await asyncio.sleep(random.uniform(0.1, 0.5))
+            await sleep(uniform(0.1, 0.5))
             
             # Simulate occasional failures (20% chance)
-            if random.random() < 0.2:
+            if rand() < 0.2:
                 raise Exception(f"Simulated API error for {endpoint}")
             
             # Simulate response
-            response_time = (time.perf_counter() - start_time) * 1000  # in ms
+            response_time = (monotonic_ns() - start_ns) / 1_000_000  # in ms
             
             return {
                 'status': 'success',
@@ -226,7 +360,7 @@ async def simulate_api_call(endpoint: str, method: str = 'GET', timeout: float =
                 }
             
             # Exponential backoff
-            await asyncio.sleep(min(0.1 * (2 ** attempts), 1.0))
+            await sleep(min(0.1 * (2 ** attempts), 1.0))
     
     return {
         'status': 'error',
@@ -236,18 +370,126 @@ async def simulate_api_call(endpoint: str, method: str = 'GET', timeout: float =
         'status_code': 500
     }
 
+def _batch_simulate(n: int, max_retries: int = 2, p_fail: float = 0.2,
+                    rng: Optional[np.random.Generator] = None) -> Tuple[np.ndarray, np.ndarray]:
+    """Draw latencies and failures for every attempt of n simulated API calls.
+    
+    Args:
+        n: Number of API calls to simulate.
+        max_retries: Retries allowed after the first attempt.
+        p_fail: Probability that a single attempt fails.
+        rng: Generator to draw from instead of the shared one; pass a seeded
+            generator for reproducible runs.
+        
+    Returns:
+        tuple: Latencies in seconds and failure flags, each shaped
+        ``(n, max_retries + 1)`` with one column per attempt.
+    """
+    rng = rng or _RNG
+    shape = (n, max_retries + 1)
+    return rng.uniform(0.1, 0.5, shape), rng.random(shape) < p_fail
+
+async def simulate_api_batch(endpoints: List[str], method: str = 'GET',
+                             max_retries: int = 2,
+                             rng: Optional[np.random.Generator] = None) -> List[Dict[str, Any]]:
+    """Simulate one API call per endpoint with retry logic in a single batch.
+    
+    Outcomes follow the same rules as simulate_api_call, but all attempts are
+    drawn up front and the event loop waits once, for the slowest call. Pass a
+    seeded ``rng`` for reproducible outcomes.
+    """
+    latencies, failures = _batch_simulate(len(endpoints), max_retries, rng=rng)
+    tries = max_retries + 1
+    succeeded = ~failures.all(axis=1)
+    attempts = np.where(succeeded, failures.argmin(axis=1) + 1, tries)
+    
+    # Time per call: every attempt made plus the exponential backoff between them
+    backoff = np.concatenate(([0.0], np.cumsum(np.minimum(0.1 * 2.0 ** np.arange(1, tries), 1.0))))
+    made = np.arange(tries) < attempts[:, None]
+    elapsed = (latencies * made).sum(axis=1) + backoff[attempts - 1]
+    await asyncio.sleep(float(elapsed.max(initial=0.0)))
+    
+    response_times = latencies[np.arange(len(endpoints)), attempts - 1] * 1000  # in ms
+    timestamp = datetime.utcnow().isoformat()
+    return [
+        {
+            'status': 'success',
+            'endpoint': endpoint,
+            'method': method,
+            'status_code': 200,
+            'response_time_ms': response_time,
+            'attempts': attempt_count,
+            'data': {
+                'id': f"{next(_CALL_IDS):08x}",
+                'timestamp': timestamp
+            }
+        } if ok else {
+            'status': 'error',
+            'endpoint': endpoint,
+            'method': method,
+            'error': f"Simulated API error for {endpoint}",
+            'attempts': attempt_count,
+            'status_code': 500
+        }
+        for endpoint, ok, attempt_count, response_time in zip(
+            endpoints, succeeded.tolist(), attempts.tolist(), response_times.tolist())
+    ]
+
+def _report_icons() -> Dict[str, str]:
+    """Return the report icons, or blanks when stdout is not a terminal."""
+    return _ICONS if sys.stdout.isatty() else _NO_ICONS
+
+def _write_lines(lines: List[str]) -> None:
+    """Write buffered report lines with a single call and clear the buffer."""
+    sys.stdout.write("\n".join(lines) + "\n")
+    lines.clear()
+
+def api_call_rows(api_calls: Dict[str, List[Any]]) -> List[Dict[str, Any]]:
+    """Rebuild per-call result dicts from a report's column-wise API calls.
+    
+    Args:
+        api_calls: The ``stats['api_calls']`` columns of a test_webhook report.
+        
+    Returns:
+        list: One dict per call, shaped like a simulate_api_call result plus
+        the ``run`` number.
+    """
+    rows = []
+    columns = zip(api_calls['run'], api_calls['endpoint'], api_calls['status'],
+                  api_calls['method'], api_calls['status_code'], api_calls['attempts'],
+                  api_calls['response_time_ms'], api_calls['error'],
+                  api_calls['id'], api_calls['timestamp'])
+    for run, endpoint, status, method, code, attempts, response_time, error, call_id, timestamp in columns:
+        row = {'run': run, 'endpoint': endpoint, 'status': status, 'method': method}
+        if status == 'success':
+            row.update({
+                'status_code': code,
+                'response_time_ms': response_time,
+                'attempts': attempts,
+                'data': {'id': call_id, 'timestamp': timestamp}
+            })
+        else:
+            row.update({'error': error, 'attempts': attempts, 'status_code': code})
+        rows.append(row)
+    return rows
+
 @measure_performance(name="webhook_test_suite")
-async def test_webhook() -> Dict[str, Any]:
+async def test_webhook(rng: Optional[np.random.Generator] = None) -> Dict[str, Any]:
     """Enhanced test function to verify webhook functionality with performance metrics.
     
     This function simulates multiple API calls, processes the results, and generates
     a comprehensive test report with performance metrics.
     
+    Args:
+        rng: Generator for the simulated API calls; pass a seeded generator
+            for reproducible runs.
+        
     Returns:
         dict: Dictionary containing test execution details and performance metrics
     """
     test_id = f"test_{uuid.uuid4().hex[:8]}"
-    test_start = datetime.utcnow()
+    test_start = datetime.utcnow()  # wall clock, for display only
+    start_ns = time.monotonic_ns()
     
     # Test configuration
     config = {
@@ -264,93 +506,131 @@ async def test_webhook() -> Dict[str, Any]:
     }
     
     # Collect system information
+    static_info = _static_system_info()
+    memory = psutil.virtual_memory()
     system_info = {
-        'system': platform.system(),
-        'release': platform.release(),
-        'python_version': platform.python_version(),
-        'processor': platform.processor(),
-        'cpu_count': psutil.cpu_count(),
+        'system': static_info['system'],
+        'release': static_info['release'],
+        'python_version': static_info['python_version'],
+        'processor': static_info['processor'],
+        'cpu_count': static_info['cpu_count'],
         'memory': {
-            'total': psutil.virtual_memory().total / (1024 ** 3),  # in GB
-            'available': psutil.virtual_memory().available / (1024 ** 3),  # in GB
-            'used': psutil.virtual_memory().used / (1024 ** 3)  # in GB
+            'total': static_info['memory_total'] / (1024 ** 3),  # in GB
+            'available': memory.available / (1024 ** 3),  # in GB
+            'used': memory.used / (1024 ** 3)  # in GB
         },
         'test_run': 4  # Current test run number
     }
     
+    # Per-call results are kept column-wise in preallocated lists
+    total_calls = config['test_runs'] * len(config['api_endpoints'])
+    call_runs = [0] * total_calls
+    call_endpoints = [''] * total_calls
+    call_statuses = [''] * total_calls
+    call_codes = [0] * total_calls
+    call_attempts = [0] * total_calls
+    call_times: List[Optional[float]] = [None] * total_calls
+    call_errors: List[Optional[str]] = [None] * total_calls
+    call_methods = [''] * total_calls
+    call_ids: List[Optional[str]] = [None] * total_calls
+    call_timestamps: List[Optional[str]] = [None] * total_calls
+    slot = 0
+    
     # Initialize test results
     test_results = {
         'total_tests': 0,
         'passed': 0,
         'failed': 0,
         'total_duration': 0.0,
-        'api_calls': [],
+        'api_calls': {
+            'run': call_runs,
+            'endpoint': call_endpoints,
+            'status': call_statuses,
+            'status_code': call_codes,
+            'attempts': call_attempts,
+            'response_time_ms': call_times,
+            'error': call_errors,
+            'method': call_methods,
+            'id': call_ids,
+            'timestamp': call_timestamps
+        },
         'start_time': test_start.isoformat(),
         'end_time': None,
         'metrics': {}
     }
     
-    # Print test header
-    print("\n" + "=" * 70)
-    print(f"🚀 WEBHOOK TEST #4 - {test_id}".center(70))
-    print("=" * 70)
-    print(f"Start Time:    {test_start.strftime('%Y-%m-%d %H:%M:%S')}")
-    print(f"System:        {system_info['system']} {system_info['release']}")
-    print(f"Python:        {system_info['python_version']}")
-    print(f"CPU Cores:     {system_info['cpu_count']}")
-    print(f"Memory:        {system_info['memory']['used']:.2f}GB / {system_info['memory']['total']:.2f}GB")
-    print("-" * 70)
+    # Report lines are buffered and written once per section
+    icons = _report_icons()
+    out = []
+    
+    # Test header
+    out.append("\n" + _HEADER)
+    out.append(f"{icons['start']}WEBHOOK TEST #4 - {test_id}".center(70))
+    out.append(_HEADER)
+    out.append(f"Start Time:    {test_start.strftime('%Y-%m-%d %H:%M:%S')}")
+    out.append(f"System:        {system_info['system']} {system_info['release']}")
+    out.append(f"Python:        {system_info['python_version']}")
+    out.append(f"CPU Cores:     {system_info['cpu_count']}")
+    out.append(f"Memory:        {system_info['memory']['used']:.2f}GB / {system_info['memory']['total']:.2f}GB")
+    out.append(_DIVIDER)
+    _write_lines(out)
     
     # Run test cases
+    endpoints = config['api_endpoints']
+    monotonic_ns = time.monotonic_ns
+    total_run_ns = 0
     for run in range(1, config['test_runs'] + 1):
-        run_start = time.perf_counter()
-        print(f"\n🔹 Test Run #{run} - Starting...")
+        run_start_ns = monotonic_ns()
+        out.append(f"\n{icons['run']}Test Run #{run} - Starting...")
+        _write_lines(out)
         
-        # Run API calls in parallel
-        tasks = [
-            simulate_api_call(endpoint, max_retries=config['max_retries'])
-            for endpoint in config['api_endpoints']
-        ]
-        
-        # Execute all API calls concurrently
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        # Simulate all API calls for this run as one batch
+        results = await simulate_api_batch(endpoints, max_retries=config['max_retries'], rng=rng)
         
         # Process results
-        run_duration = time.perf_counter() - run_start
+        run_ns = monotonic_ns() - run_start_ns
+        run_duration = run_ns / 1e9
         successful = 0
         failed = 0
         
-        for i, result in enumerate(results):
+        for endpoint, result in zip(endpoints, results):
             test_results['total_tests'] += 1
             
-            if isinstance(result, Exception):
-                result = {'status': 'error', 'error': str(result)}
-                failed += 1
-            elif result.get('status') == 'success':
+            if result['status'] == 'success':
                 successful += 1
             else:
                 failed += 1
             
-            test_results['api_calls'].append({
-                'run': run,
-                'endpoint': config['api_endpoints'][i],
-                **result
-            })
+            call_runs[slot] = run
+            call_endpoints[slot] = endpoint
+            call_statuses[slot] = result['status']
+            call_codes[slot] = result['status_code']
+            call_attempts[slot] = result['attempts']
+            call_times[slot] = result.get('response_time_ms')
+            call_errors[slot] = result.get('error')
+            call_methods[slot] = result['method']
+            data = result.get('data')
+            if data is not None:
+                call_ids[slot] = data['id']
+                call_timestamps[slot] = data['timestamp']
+            slot += 1
         
         # Update statistics
         test_results['passed'] += successful
         test_results['failed'] += failed
-        test_results['total_duration'] += run_duration
+        total_run_ns += run_ns
         
-        # Print run summary
-        print(f"   ✅ {successful} passed")
+        # Run summary
+        out.append(f"   {icons['passed']}{successful} passed")
         if failed > 0:
-            print(f"   ❌ {failed} failed")
-        print(f"   ⏱️  Duration: {run_duration:.2f}s")
+            out.append(f"   {icons['failed']}{failed} failed")
+        out.append(f"   {icons['duration']}Duration: {run_duration:.2f}s")
+        _write_lines(out)
     
     # Calculate final metrics
+    test_results['total_duration'] = total_run_ns / 1e9
+    total_duration = (time.monotonic_ns() - start_ns) / 1e9
     test_end = datetime.utcnow()
-    total_duration = (test_end - test_start).total_seconds()
     success_rate = (test_results['passed'] / test_results['total_tests'] * 100) if test_results['total_tests'] > 0 else 0
     
     # Prepare final report
@@ -379,53 +659,73 @@ async def test_webhook() -> Dict[str, Any]:
         }
     }
     
-    # Print final summary
-    print("\n" + "=" * 70)
-    print("📊 TEST SUMMARY".center(70))
-    print("=" * 70)
-    print(f"Total Tests:  {report['stats']['total_tests']}")
-    print(f"✅ Passed:     {report['stats']['passed']}")
-    print(f"❌ Failed:     {report['stats']['failed']}")
-    print(f"📈 Success:    {report['stats']['success_rate']}%")
-    print(f"⏱️  Duration:   {total_duration:.2f} seconds")
-    print("=" * 70)
+    # Final summary
+    out.append("\n" + _HEADER)
+    out.append(f"{icons['summary']}TEST SUMMARY".center(70))
+    out.append(_HEADER)
+    out.append(f"{icons['none']}{'Total Tests:':<14}{report['stats']['total_tests']}")
+    out.append(f"{icons['passed']}{'Passed:':<14}{report['stats']['passed']}")
+    out.append(f"{icons['failed']}{'Failed:':<14}{report['stats']['failed']}")
+    out.append(f"{icons['success']}{'Success:':<14}{report['stats']['success_rate']}%")
+    out.append(f"{icons['duration']}{'Duration:':<14}{total_duration:.2f} seconds")
+    out.append(_HEADER)
+    _write_lines(out)
     
     return report
 
 
+def _generate_and_analyze(size: int = 1000) -> Tuple[np.ndarray, Dict[str, float], Dict[str, Any]]:
+    """Generate a random sample and compute its statistics.
+    
+    Meant to run on _EXECUTOR so the event loop stays responsive.
+    
+    Args:
+        size: Number of values to generate.
+        
+    Returns:
+        tuple: The sample, its statistics and the processing metrics.
+    """
+    numbers = _RNG.integers(1, 1001, size=size)
+    with PerformanceTracker('data_processing') as tracker:
+        processor = DataProcessor(numbers)
+        stats = processor.get_statistics()
+    return numbers, stats, tracker.metrics
+
+
 async def main():
     """Main function to run the webhook test suite with enhanced testing."""
+    icons = _report_icons()
     try:
-        print("🚀 Starting Webhook Test Suite v4.0.0...")
+        print(f"{icons['start']}Starting Webhook Test Suite v4.0.0...")
         print("-" * 70)
         
         # Run the webhook test
         test_result = await test_webhook()
         
-        # Process test results
-        if 'error' in test_result:
-            raise Exception(f"Test failed: {test_result.get('error')}")
+        # measure_performance only wraps the report when tracking is on
+        if _PERF_TRACK:
+            if 'error' in test_result:
+                raise Exception(f"Test failed: {test_result.get('error')}")
+            test_result = test_result['result']
         
         # Generate a data processing report
-        numbers = [random.randint(1, 1000) for _ in range(1000)]
-        with PerformanceTracker('data_processing') as tracker:
-            processor = DataProcessor(numbers)
-            stats = processor.get_statistics()
-            data_metrics = tracker.metrics
+        numbers, stats, data_metrics = await asyncio.get_running_loop().run_in_executor(
+            _EXECUTOR, _generate_and_analyze)
         
         # Print data processing results
-        print("\n" + "📊 DATA PROCESSING RESULTS".center(70, '-'))
+        print("\n" + f"{icons['summary']}DATA PROCESSING RESULTS".center(70, '-'))
         print("-" * 70)
         print(f"Items Processed: {len(numbers):,}")
         print(f"Processing Time: {data_metrics['wall_time']:.4f}s")
         print(f"Memory Used:     {data_metrics['memory_used_mb']:.2f} MB")
         
         # Print statistics
-        print("\nStatistics:" + " " * 63 + "📈")
+        print(f"\nStatistics:{' ' * 63}{icons['success']}".rstrip())
         for key, value in stats.items():
             print(f"  {key.upper()}: {value:.4f}" if isinstance(value, float) else f"  {key.upper()}: {value}")
         
         # Prepare final result
+        static_info = _static_system_info()
         result = {
             'status': 'success',
             'test_id': test_result['test_id'],
@@ -447,15 +747,15 @@ async def main():
                 'memory_used_mb': data_metrics['memory_used_mb']
             },
             'system': {
-                'platform': platform.platform(),
-                'python': platform.python_version(),
-                'cpu_count': psutil.cpu_count(),
-                'memory_gb': psutil.virtual_memory().total / (1024 ** 3)
+                'platform': static_info['platform'],
+                'python': static_info['python_version'],
+                'cpu_count': static_info['cpu_count'],
+                'memory_gb': static_info['memory_total'] / (1024 ** 3)
             }
         }
         
         # Print final summary
-        print("\n" + "✅ TEST COMPLETED SUCCESSFULLY".center(70, '='))
+        print("\n" + f"{icons['passed']}TEST COMPLETED SUCCESSFULLY".center(70, '='))
         print(f"Test ID:       {result['test_id']}")
         print(f"Duration:      {result['timing']['total_duration']:.2f} seconds")
         print(f"Success Rate:  {result['stats']['success_rate']}%")
@@ -465,7 +765,7 @@ async def main():
         return result
         
     except Exception as e:
-        error_msg = f"❌ Test execution failed: {str(e)}"
+        error_msg = f"{icons['failed']}Test execution failed: {str(e)}"
         print(f"\n{error_msg}")
         print(f"Error type: {type(e).__name__}")
         
@@ -480,8 +780,8 @@ async def main():
             'error_type': type(e).__name__,
             'timestamp': datetime.utcnow().isoformat(),
             'system': {
-                'platform': platform.platform(),
-                'python': platform.python_version()
+                'platform': _static_system_info()['platform'],
+                'python': _static_system_info()['python_version']
             }
         }
 
@@ -5,6 +5,12 @@ import os
 import subprocess
 import pickle
 import base64
+import hashlib
+
+try:
+    import orjson as json_lib
+except ImportError:
+    import json as json_lib
 
 # Hardcoded credentials (Security issue: Hardcoded secret)
 API_KEY = "s3cr3t_k3y_12345"
@@ -29,6 +35,11 @@ def deserialize_data(serialized_data):
     """Deserialize data (vulnerable to arbitrary code execution)."""
     return pickle.loads(base64.b64decode(serialized_data))
 
+# Safe deserialization for plain data payloads
+def deserialize_json_data(serialized_data):
+    """Deserialize base64-encoded JSON data (no code execution possible)."""
+    return json_lib.loads(base64.b64decode(serialized_data))
+
 # Hardcoded encryption key (Security issue: Insecure key management)
 ENCRYPTION_KEY = b'ThisIsAVeryInsecureKey123!'
 
@@ -59,7 +70,6 @@ def hash_password_insecure(password):
     Insecure password hashing using MD5 (vulnerable to rainbow table attacks).
     WARNING: This is intentionally vulnerable for testing purposes.
     """
-    import hashlib
     # Using MD5 which is cryptographically broken (Security issue)
     return hashlib.md5(password.encode()).hexdigest()
 